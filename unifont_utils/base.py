@@ -1,6 +1,7 @@
 # -*- encoding: utf-8 -*-
 """Unifont Utils - Base Module"""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Set, Optional, Union, TypeAlias
 from collections.abc import Sequence
@@ -10,6 +11,42 @@ FilePath: TypeAlias = Union[str, Path]
 CodePoint: TypeAlias = Union[str, int]
 CodePoints: TypeAlias = Union[Sequence[CodePoint], Set[CodePoint]]
 
+_HEX_DIGITS = "0123456789ABCDEF"
+_HEX_DIGITS_BYTES = _HEX_DIGITS.encode("ascii")
+
+
+def _first_invalid_hex_char(s: str) -> Optional[str]:
+    """Return the first character of a string that is not an uppercase hex digit.
+
+    The check deletes every valid digit with `bytes.translate` in a single C-level pass;
+    the string is only walked in Python to report the offending character.
+    """
+
+    if not s.encode("utf-8").translate(None, _HEX_DIGITS_BYTES):
+        return None
+    return next(c for c in s if c not in _HEX_DIGITS)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_code_point(code_point: CodePoint) -> str:
+    """Helper function to normalize a code point that is a string or an integer.
+
+    Results are cached, since the same code points are looked up again and again.
+    """
+
+    if isinstance(code_point, int):
+        code_point = hex(code_point)[2:]
+
+    if not code_point.isalnum() or int(code_point, 16) > 0x10FFFF:
+        raise ValueError(f"Invalid code point: {code_point}.")
+
+    code_point = code_point.upper()
+
+    if (c := _first_invalid_hex_char(code_point)) is not None:
+        raise ValueError(f"Invalid character in code point: {c}.")
+
+    return code_point.zfill(6 if len(code_point) > 4 else 4)
+
 
 class Validator:
     """Class for validators."""
@@ -29,23 +66,10 @@ class Validator:
             ValueError: If the code point is invalid.
         """
 
-        if isinstance(code_point, int):
-            code_point = hex(code_point)[2:]
-        elif isinstance(code_point, str):
-            pass
-        else:
+        if not isinstance(code_point, (int, str)):
             raise TypeError("Invalid code point type. Must be a string or integer.")
 
-        if not code_point.isalnum() or int(code_point, 16) > 0x10FFFF:
-            raise ValueError(f"Invalid code point: {code_point}.")
-
-        code_point = code_point.upper()
-
-        for c in code_point:
-            if c not in "0123456789ABCDEF":
-                raise ValueError(f"Invalid character in code point: {c}.")
-
-        return code_point.zfill(6 if len(code_point) > 4 else 4)
+        return _normalize_code_point(code_point)
 
     @staticmethod
     def code_points(code_points: CodePoints) -> List[str]:
@@ -70,7 +94,13 @@ class Validator:
         if not all(isinstance(c, (str, int)) for c in code_points):
             raise TypeError("The code points in the list must be strings or integers.")
 
-        code_points_list = [hex(int(i))[2:].zfill(4) for i in list(set(code_points))]
+        values = [int(i) for i in set(code_points)]
+        if values and 0 <= min(values) and max(values) <= 0x10FFFF:
+            # Every value is in range, so format them directly instead of
+            # validating each one again.
+            return [f"{i:04X}" if i <= 0xFFFF else f"{i:06X}" for i in values]
+
+        code_points_list = [hex(i)[2:].zfill(4) for i in values]
 
         return [Validator.code_point(code_point) for code_point in code_points_list]
 
@@ -96,9 +126,8 @@ class Validator:
                 f"Invalid .hex string length: {hex_str} (length: {len(hex_str)})."
             )
 
-        for c in hex_str:
-            if c not in "0123456789ABCDEF":
-                raise ValueError(f"Invalid character in .hex string: {c}.")
+        if (c := _first_invalid_hex_char(hex_str)) is not None:
+            raise ValueError(f"Invalid character in .hex string: {c}.")
 
         return hex_str.upper()
 
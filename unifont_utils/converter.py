@@ -1,9 +1,11 @@
 # -*- encoding: utf-8 -*-
 """Unifont Utils - Converter"""
 
-from functools import reduce
 from typing import List
 
+_BINARY_DIGITS_TO_BITS = bytes.maketrans(b"01", b"\x00\x01")
+_BITS_TO_BINARY_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+
 
 class Converter:
     """Class for converters."""
@@ -27,7 +29,8 @@ class Converter:
                 "Unable to convert to .hex string. The glyph data is empty."
             )
 
-        n = reduce(lambda acc, pixel: (acc << 1) | (1 if pixel else 0), data, 0)
+        binary = bytes(map(bool, data)).translate(_BITS_TO_BINARY_DIGITS)
+        n = int(binary, 2)
         return hex(n)[2:].upper().zfill(32 if len(data) == 128 else 64)
 
     @staticmethod
@@ -43,7 +46,24 @@ class Converter:
             List[int]: The glyph pixel data in the image, stored as `0` and `1`.
         """
 
+        return list(Converter.to_img_bytes(hex_str, width, height))
+
+    @staticmethod
+    def to_img_bytes(hex_str: str, width: int = 16, height: int = 16) -> bytes:
+        """Convert Unifont `.hex` format string to glyph pixel data as bytes.
+
+        Args:
+            hex_str (str): The Unifont `.hex` format string.
+            width (int, optional): The width of the glyph in pixels. Defaults to `16`.
+            height (int, optional): The height of the glyph in pixels. Defaults to `16`.
+
+        Returns:
+            bytes: The glyph pixel data in the image, one byte of `0` or `1` per pixel.
+        """
+
         if not hex_str:
-            return []
+            return b""
 
-        return [(int(hex_str, 16) >> i) & 1 for i in range(width * height - 1, -1, -1)]
+        size = width * height
+        binary = format(int(hex_str, 16), f"0{size}b")[-size:]
+        return binary.encode("ascii").translate(_BINARY_DIGITS_TO_BITS)
@@ -1,6 +1,7 @@
 # -*- encoding: utf-8 -*-
 """Unifont Utils - Diff"""
 
+from itertools import groupby
 from typing import List, Union
 
 from rich.console import Console
@@ -11,6 +12,9 @@ from .base import Validator as V
 from .converter import Converter as C
 from .glyphs import Glyph
 
+# Indexed by `2 * a + b` for the pixels `a` and `b` of the two glyphs.
+_DIFF_SYMBOLS = ("0", "+", "-", "1")
+
 
 def get_img_data(glyph: Union[str, Glyph]) -> List[int]:
     """Input a `.hex` string or a Glyph object and output its image data.
@@ -48,22 +52,16 @@ def diff_glyphs(glyph_a: Union[str, Glyph], glyph_b: Union[str, Glyph]) -> List[
         ValueError: If the two glyphs have different sizes.
     """
 
-    a, b = get_img_data(glyph_a), get_img_data(glyph_b)
+    return _diff_img_data(get_img_data(glyph_a), get_img_data(glyph_b))
+
+
+def _diff_img_data(a: List[int], b: List[int]) -> List[str]:
+    """Helper function to compare the image data of two glyphs."""
+
     if len(a) != len(b):
         raise ValueError("The two glyphs must have the same size.")
 
-    diff_list = []
-    for i, j in zip(a, b):
-        if i and not j:
-            diff_list.append("-")
-        elif not i and j:
-            diff_list.append("+")
-        elif i and j:
-            diff_list.append("1")
-        else:
-            diff_list.append("0")
-
-    return diff_list
+    return [_DIFF_SYMBOLS[2 * i + j] for i, j in zip(a, b)]
 
 
 def print_diff(
@@ -86,8 +84,8 @@ def print_diff(
             If `False`, `0` is transparent and `1` is white.
     """
 
-    diff_list = diff_glyphs(glyph_a, glyph_b)
     a, b = get_img_data(glyph_a), get_img_data(glyph_b)
+    diff_list = _diff_img_data(a, b)
     console = Console()
 
     white_block = "white on white"
@@ -97,26 +95,26 @@ def print_diff(
         white_block, black_block = black_block, white_block
 
     width = len(a) // 16
+    row_diff = {
+        "+": "green on green",
+        "-": "red on red",
+        "1": white_block,
+        "0": black_block,
+    }
 
     def get_row(i: int, data: List[int]) -> Text:
         row_text = Text()
         row_data = data[i * width : (i + 1) * width]
-        for pixel in row_data:
+        for pixel, run in groupby(row_data):
             block_style = white_block if pixel else black_block
-            row_text.append("  ", style=block_style)
+            row_text.append("  " * len(list(run)), style=block_style)
         return row_text
 
     def get_row_diff(i: int) -> Text:
         row_text = Text()
-        row_diff = {
-            "+": "green on green",
-            "-": "red on red",
-            "1": white_block,
-            "0": black_block,
-        }
-        for element in diff_list[i * width : (i + 1) * width]:
+        for element, run in groupby(diff_list[i * width : (i + 1) * width]):
             block_style = row_diff.get(str(element), black_block)
-            row_text.append("  ", style=block_style)
+            row_text.append("  " * len(list(run)), style=block_style)
         return row_text
 
     table = Table(show_lines=False, expand=False)
@@ -1,7 +1,8 @@
 # -*- encoding: utf-8 -*-
 """Unifont Utils - Editor"""
 
-from typing import Tuple
+from itertools import groupby
+from typing import List, Optional, Tuple
 
 from rich.text import Text
 from rich.panel import Panel
@@ -14,6 +15,21 @@ from textual.reactive import reactive
 from .glyphs import Glyph, SearchPattern, ReplacePattern
 
 
+_HEX_NUMS = tuple(f"{i:2X}" for i in range(16))
+"""The hexadecimal representation of each row and column index."""
+_COLORS = tuple(
+    "auto" if i % 2 == 0 else ("green" if i > 9 else "red") for i in range(16)
+)
+"""The color of each row and column index."""
+
+
+def _get_pixel_color(value: int, dark: bool) -> str:
+    """Get the color of a pixel block."""
+    if value == 1:
+        return "white" if dark else "black"
+    return "black" if dark else "white"
+
+
 class EditWidget(Static, can_focus=True):
     """Widget to display and edit a Glyph."""
 
@@ -48,38 +64,26 @@ class EditWidget(Static, can_focus=True):
     def render_glyph(self) -> None:
         """Render the glyph with the current cursor position."""
 
-        def get_color(i: int) -> str:
-            """Get color based on index."""
-            return "auto" if i % 2 == 0 else ("green" if i > 9 else "red")
-
-        def get_pixel_color(value: int) -> str:
-            if value:
-                return "white" if self.app.dark else "black"
-            return "black" if self.app.dark else "white"
-
         def get_block_style(is_cursor: bool, data_value: int) -> str:
             """Get style for the glyph block."""
-            pixel = get_pixel_color(data_value)
+            pixel = _get_pixel_color(data_value, self.app.dark)
             return f"{'red' if is_cursor else pixel} on {pixel}"
 
-        def get_nums(i: int) -> str:
-            """Get the hexadecimal representation of index."""
-            return hex(i)[2:].rjust(2).upper()
-
         width = self.glyph.width
+        data = self.glyph.data
         glyph = Text("\n  ")
         # Columns
         for i in range(width):
-            glyph.append(get_nums(i), style=f"{get_color(i)} bold")
+            glyph.append(_HEX_NUMS[i], style=f"{_COLORS[i]} bold")
         glyph.append("\n")
 
         for i in range(16):
             # Rows
-            glyph.append(f"{get_nums(i)} ", style=f"{get_color(i)} bold")
+            glyph.append(f"{_HEX_NUMS[i]} ", style=f"{_COLORS[i]} bold")
             # Glyph pixel blocks
             for j in range(width):
                 is_cursor = self.cursor_x == j % width and self.cursor_y == i
-                block_style = get_block_style(is_cursor, self.glyph.data[i * width + j])
+                block_style = get_block_style(is_cursor, data[i * width + j])
                 char = "⬥ " if is_cursor else "  "
                 glyph.append(char, style=block_style)
             glyph.append("\n")
@@ -187,6 +191,8 @@ class ReplaceWidget(Static, can_focus=True):
         self.search_pattern = search_pattern
         self.replace_pattern = replace_pattern
         self.matches = self.glyph.find_matches(search_pattern)
+        self._base_styles: List[List[str]] = []
+        self._base_styles_key: Optional[Tuple[str, bool]] = None
 
     def on_mount(self) -> None:
         """Actions that are executed when the widget is mounted."""
@@ -200,50 +206,34 @@ class ReplaceWidget(Static, can_focus=True):
     def render_glyph(self) -> None:
         """Render the glyph with the current cursor position."""
 
-        def get_color(i: int) -> str:
-            """Get color based on index."""
-            return "auto" if i % 2 == 0 else ("green" if i > 9 else "red")
-
-        def get_pixel_color(value: int) -> str:
-            if value == 1:
-                return "white" if self.app.dark else "black"
-            return "black" if self.app.dark else "white"
-
-        def get_block_style(i: int, j: int, current_match: Tuple[int, int]) -> str:
-
-            width = self.glyph.width
-            h = self.replace_pattern.height
-            w = self.replace_pattern.width
-            x, y = current_match
-
-            if current_match and x <= i < x + h and y <= j < y + w:
-                pixel = self.replace_pattern.data[(i - x) * w + (j - y)]
-                pixel_color = get_pixel_color(pixel)
-                if pixel == 1:
-                    return "green on green"
-                return f"{pixel_color} on {pixel_color}"
-            pixel_color = get_pixel_color(self.glyph.data[i * width + j])
-            return f"{pixel_color} on {pixel_color}"
-
-        def get_nums(i: int) -> str:
-            """Get the hexadecimal representation of index."""
-            return hex(i)[2:].rjust(2).upper()
-
         width = self.glyph.width
         glyph = Text("\n  ")
         # Columns
         for i in range(width):
-            glyph.append(get_nums(i), style=f"{get_color(i)} bold")
+            glyph.append(_HEX_NUMS[i], style=f"{_COLORS[i]} bold")
         glyph.append("\n")
 
-        current_match = self.matches[self.match_index]
+        # Only the blocks covered by the current match differ from the base styles.
+        styles = list(self._get_base_styles())
+        x, y = self.matches[self.match_index]
+        h = self.replace_pattern.height
+        w = self.replace_pattern.width
+        pattern = self.replace_pattern.data
+        for i in range(x, min(x + h, 16)):
+            styles[i] = row = styles[i].copy()
+            for j in range(y, min(y + w, width)):
+                pixel = pattern[(i - x) * w + (j - y)]
+                if pixel == 1:
+                    row[j] = "green on green"
+                else:
+                    pixel_color = _get_pixel_color(pixel, self.app.dark)
+                    row[j] = f"{pixel_color} on {pixel_color}"
 
         for i in range(16):
             # Rows
-            glyph.append(f"{get_nums(i)} ", style=f"{get_color(i)} bold")
-            for j in range(width):
-                block_style = get_block_style(i, j, current_match)
-                glyph.append("  ", style=block_style)
+            glyph.append(f"{_HEX_NUMS[i]} ", style=f"{_COLORS[i]} bold")
+            for block_style, run in groupby(styles[i]):
+                glyph.append("  " * len(list(run)), style=block_style)
             glyph.append("\n")
 
         match_index_text = Text(
@@ -261,6 +251,24 @@ class ReplaceWidget(Static, can_focus=True):
             Group(Text(self.glyph.unicode_name, justify="center", style="bold"), panel)
         )
 
+    def _get_base_styles(self) -> List[List[str]]:
+        """Get the styles of the glyph pixel blocks without a match highlighted,
+        recomputing them only after the glyph or the dark mode has changed."""
+        key = (self.glyph.hex_str, self.app.dark)
+        if self._base_styles_key != key:
+            width = self.glyph.width
+            data = self.glyph.data
+            pixel_styles = {}
+            for value in (0, 1):
+                pixel_color = _get_pixel_color(value, self.app.dark)
+                pixel_styles[value] = f"{pixel_color} on {pixel_color}"
+            self._base_styles = [
+                [pixel_styles[value] for value in data[i * width : (i + 1) * width]]
+                for i in range(16)
+            ]
+            self._base_styles_key = key
+        return self._base_styles
+
     def action_prev(self) -> None:
         """Move the cursor to the previous match."""
         if self.matches:
@@ -274,10 +282,24 @@ class ReplaceWidget(Static, can_focus=True):
     def action_apply(self) -> None:
         """Apply the replacement to the glyph at the current match."""
         if self.matches:
-            match_pos = self.matches[self.match_index]
-            self.glyph.apply_pattern(match_pos[0], match_pos[1], self.replace_pattern)
+            x, y = self.matches[self.match_index]
+            self.glyph.apply_pattern(x, y, self.replace_pattern)
             self.render_glyph()
-        self.matches = self.glyph.find_matches(self.search_pattern)
+
+            # Only the matches overlapping the replaced blocks can have changed.
+            top = x - self.search_pattern.height + 1
+            left = y - self.search_pattern.width + 1
+            bottom = x + self.replace_pattern.height
+            right = y + self.replace_pattern.width
+            kept = [
+                (i, j)
+                for i, j in self.matches
+                if not (top <= i < bottom and left <= j < right)
+            ]
+            found = self.glyph.find_matches_in_region(
+                self.search_pattern, top, left, bottom, right
+            )
+            self.matches = sorted(kept + found)
 
     def action_quit(self) -> None:
         """Quit the application."""
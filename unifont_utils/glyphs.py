@@ -1,10 +1,29 @@
 # -*- encoding: utf-8 -*-
 """Unifont Utils - Glyphs"""
 
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+import mmap
+import re
+import sys
 import time
 from unicodedata import name
-from typing import Dict, List, Tuple, Iterator, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Dict,
+    List,
+    Tuple,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
 
 from PIL import Image as Img
 from rich.console import Console
@@ -29,12 +48,162 @@ COLOR_VALUE_MAP = {
     (0, 0, 0, 0): "transparent",
 }
 
+_BYTE_TO_MASK = tuple(
+    bytes(255 if value >> bit & 1 else 0 for bit in range(7, -1, -1))
+    for value in range(256)
+)
+"""The 8 pixels of an `L` mode mask for each byte of a `.hex` format string."""
+
+_HEX_LINE_PATTERN = re.compile(
+    rb"^[ \t]*([0-9A-Fa-f]{1,6}):((?:[0-9A-F]{32}){1,2})[ \t\r]*$", re.M
+)
+"""Matches a well-formed line of a `.hex` file."""
+_NON_BLANK_LINE_PATTERN = re.compile(rb"^[ \t\r\f\v]*\S", re.M)
+"""Matches the start of a line that is not blank."""
+
+
+def _pack_rgba(rgba: Tuple[int, int, int, int]) -> int:
+    """Pack an RGBA tuple into the integer that `memoryview.cast("I")` yields
+    for the same pixel in the bytes of an RGBA image."""
+    return int.from_bytes(bytes(rgba), sys.byteorder)
+
+
+def _unpack_rgba(packed: int) -> Tuple[int, int, int, int]:
+    """Unpack an integer created by `_pack_rgba` into an RGBA tuple."""
+    r, g, b, a = packed.to_bytes(4, sys.byteorder)
+    return r, g, b, a
+
+
+def _packed_pixels(img: Img.Image) -> memoryview:
+    """Get the pixels of an RGBA image as packed integers without creating
+    a tuple per pixel."""
+    return memoryview(img.tobytes()).cast("I")
+
+
+_PACKED_COLOR_VALUE_MAP = {
+    _pack_rgba(rgba): color for rgba, color in COLOR_VALUE_MAP.items()
+}
+_SCHEME_BY_PACKED_COLORS = {
+    (_pack_rgba(COLOR_MAP[background]), _pack_rgba(COLOR_MAP[foreground])): scheme
+    for (background, foreground), scheme in {
+        ("white", "black"): "black_and_white",
+        ("black", "white"): "inverted_black_and_white",
+        ("transparent", "black"): "transparent_and_black",
+        ("transparent", "white"): "transparent_and_white",
+    }.items()
+}
+_PATTERN_VALUE_MAP = {
+    _pack_rgba(COLOR_MAP["white"]): 0,
+    _pack_rgba(COLOR_MAP["black"]): 1,
+    _pack_rgba(COLOR_MAP["transparent"]): -1,
+}
+
+
+_ROW_DIGITS = {
+    value: bytes(49 if byte == value & 0xFF else 48 for byte in range(256))
+    for value in (-1, 0, 1)
+}
+"""Translation tables from signed pattern bytes to the binary digit of each pixel,
+`1` where the pixel equals the key and `0` elsewhere."""
+
+
+def _pack_rows(data: array, width: int, height: int, value: int = 1) -> List[int]:
+    """Pack pixel data into one integer per row.
+
+    A bit is set where the pixel equals `value`; the leftmost pixel of a row is
+    the most significant bit.
+    """
+
+    digits = data.tobytes().translate(_ROW_DIGITS[value])
+    return [int(digits[y * width : (y + 1) * width], 2) for y in range(height)]
+
+
+def _bytes_to_rows(raw: bytes, width: int) -> List[int]:
+    """Split a decoded `.hex` format string into one integer per glyph row."""
+    if width == 8:
+        return list(raw)
+    rows = array("H", raw)
+    if sys.byteorder == "little":
+        rows.byteswap()
+    return rows.tolist()
+
+
+def _rows_to_hex(rows: Sequence[int], width: int) -> str:
+    """Join integers created by `_bytes_to_rows` back into a `.hex` format string."""
+    if width == 8:
+        return bytes(rows).hex().upper()
+    packed = array("H", rows)
+    if sys.byteorder == "little":
+        packed.byteswap()
+    return packed.tobytes().hex().upper()
+
+
+def _mask_bits(masks: Sequence[int], width: int) -> List[List[int]]:
+    """List the positions of the set bits of each row mask, counted from the right."""
+    return [[b for b in range(width) if mask >> b & 1] for mask in masks]
+
+
+def _match_candidates(
+    rows: Sequence[int], mask_bits: Sequence[Sequence[int]], max_shift: int
+) -> int:
+    """Get the shifts at which a pattern matches a window of packed glyph rows.
+
+    Bit `s` of `row >> b` is pixel `s + b` of the row (counted from the right), so
+    ANDing each row shifted by every set bit of its mask leaves bit `s` of the result
+    set exactly where the pattern matches with a shift of `s`.
+    """
+
+    candidates = (1 << (max_shift + 1)) - 1
+    for row, bits in zip(rows, mask_bits):
+        for b in bits:
+            candidates &= row >> b
+    return candidates
+
+
+def _apply_rows(
+    rows: List[int], i: int, shift: int, ones: Sequence[int], zeros: Sequence[int]
+) -> None:
+    """Set the `ones` bits and clear the `zeros` bits of the packed glyph rows
+    starting at row `i`, both shifted left by `shift`."""
+    for y, (one, zero) in enumerate(zip(ones, zeros)):
+        rows[i + y] = (rows[i + y] & ~(zero << shift)) | (one << shift)
+
+
+def _replace_pattern(
+    rows: List[int],
+    image_width: int,
+    pattern_a: array,
+    pattern_b: array,
+    width: int,
+    height: int,
+) -> None:
+    """Replace every match of a search pattern in packed glyph rows in place.
+
+    Matching and applying share one pass over the candidate positions, so a
+    replacement is already visible when the following positions are checked.
+    """
+
+    mask_bits = _mask_bits(_pack_rows(pattern_a, width, height), width)
+    ones = _pack_rows(pattern_b, width, height)
+    zeros = _pack_rows(pattern_b, width, height, 0)
+    max_shift = image_width - width
+
+    for i in range(16 - height + 1):
+        candidates = _match_candidates(rows[i : i + height], mask_bits, max_shift)
+        for j in range(max_shift + 1):
+            shift = max_shift - j
+            if not candidates >> shift & 1:
+                continue
+            _apply_rows(rows, i, shift, ones, zeros)
+            candidates = _match_candidates(rows[i : i + height], mask_bits, max_shift)
+
+
 @dataclass
 class Pattern:
     """A class to represent a pattern.
 
     Attributes:
-        data (List[int]): The pattern data.
+        data (Sequence[int]): The pattern data, stored as a signed byte array.
         width (int): The width of the pattern.
         height (Optional[int]): The height of the pattern.
 
@@ -42,8 +211,8 @@ class Pattern:
         ValueError: If the size of the pattern is invalid.
     """
 
-    data: List[int]
-    """The pattern data."""
+    data: Sequence[int]
+    """The pattern data, stored as a signed byte array."""
     _width: int
     """The width of the pattern."""
     _height: Optional[int] = None
@@ -66,6 +235,7 @@ class Pattern:
             raise ValueError("The height must be greater than 2 pixels.")
         if self._height > 16:
             raise ValueError("The height must be less than 16 pixels.")
+        self.data = array("b", self.data)
 
     def __str__(self) -> str:
         return f"Unifont Pattern ({self._width}x{self._height})"
@@ -82,6 +252,26 @@ class Pattern:
             self._height = len(self.data) // self._width
         return self._height
 
+    @staticmethod
+    def _validate_values(data: Sequence[int], allowed: bytes, message: str) -> array:
+        """Helper function to validate the pattern values and convert them to a signed
+        byte array. `allowed` holds the permitted values as unsigned bytes, so `-1` is
+        written as `0xFF`."""
+        try:
+            try:
+                values = array("b", data)
+            except TypeError:
+                # Other numbers, such as `1.0`, are allowed if equal to an integer.
+                integers = [int(i) for i in data]
+                if integers != list(data):
+                    raise
+                values = array("b", integers)
+        except (OverflowError, TypeError, ValueError):
+            raise ValueError(message) from None
+        if values.tobytes().translate(None, allowed):
+            raise ValueError(message)
+        return values
+
     @classmethod
     def init_from_img(cls, img_path: FilePath) -> "Pattern":
         """Create a new Pattern object from an image file.
@@ -98,16 +288,12 @@ class Pattern:
             raise FileNotFoundError(f"File not found: {img_path}")
 
         img = Img.open(img_path).convert("RGBA")
-        data = []
-        for pixel in img.getdata():  # type: ignore
-            if pixel == (255, 255, 255, 255):
-                data.append(0)
-            elif pixel == (0, 0, 0, 255):
-                data.append(1)
-            elif pixel == (0, 0, 0, 0):
-                data.append(-1)
-            else:
-                raise ValueError(f"Invalid pixel RGBA value: {pixel}")
+        pixels = _packed_pixels(img)
+        try:
+            data = list(map(_PATTERN_VALUE_MAP.__getitem__, pixels))
+        except KeyError as exc:
+            pixel = _unpack_rgba(exc.args[0])
+            raise ValueError(f"Invalid pixel RGBA value: {pixel}") from None
 
         return cls(data, img.size[0], img.size[1])
 
@@ -117,8 +303,11 @@ class SearchPattern(Pattern):
     """A class to represent a pattern for searching."""
 
     def __post_init__(self) -> None:
-        if not all(i in {0, 1} for i in self.data):
-            raise ValueError("The pattern data must be a list of integers 0 and 1.")
+        self.data = self._validate_values(
+            self.data,
+            b"\x00\x01",
+            "The pattern data must be a list of integers 0 and 1.",
+        )
 
     @classmethod
     def init_from_img(cls, img_path: FilePath) -> "SearchPattern":
@@ -131,10 +320,11 @@ class ReplacePattern(Pattern):
     """A class to represent a pattern for replacing."""
 
     def __post_init__(self) -> None:
-        if not all(i in {0, 1, -1} for i in self.data):
-            raise ValueError(
-                "The pattern data must be a list of integers 0, 1, and -1."
-            )
+        self.data = self._validate_values(
+            self.data,
+            b"\x00\x01\xff",
+            "The pattern data must be a list of integers 0, 1, and -1.",
+        )
 
     @classmethod
     def init_from_img(cls, img_path: FilePath) -> "ReplacePattern":
@@ -143,17 +333,35 @@ class ReplacePattern(Pattern):
 
 
 class ColorScheme:
-    """A class to represent a color scheme."""
+    """A class to represent a color scheme.
+
+    Color schemes are immutable and compare equal by name, so one instance can be
+    shared by any number of glyphs.
+    """
+
+    __slots__ = (
+        "_scheme_name",
+        "_color_map",
+        "_inverse_color_map",
+        "_rgba_lut",
+        "_value_lut",
+    )
 
     _scheme_name: str
     """The name of the color scheme."""
-    _color_map: Dict[int, str]
+    _color_map: Mapping[str, int]
     """The color map of the color scheme."""
+    _inverse_color_map: Dict[int, str]
+    """The color names of the color scheme, indexed by pixel value."""
+    _rgba_lut: Tuple[bytes, ...]
+    """The RGBA bytes of each pixel value, indexed by pixel value."""
+    _value_lut: Dict[int, int]
+    """The pixel value of each packed RGBA color used by the color scheme."""
     _available_schemes = {
-        "black_and_white": {"white": 0, "black": 1},
-        "inverted_black_and_white": {"black": 0, "white": 1},
-        "transparent_and_black": {"transparent": 0, "black": 1},
-        "transparent_and_white": {"transparent": 0, "white": 1},
+        "black_and_white": MappingProxyType({"white": 0, "black": 1}),
+        "inverted_black_and_white": MappingProxyType({"black": 0, "white": 1}),
+        "transparent_and_black": MappingProxyType({"transparent": 0, "black": 1}),
+        "transparent_and_white": MappingProxyType({"transparent": 0, "white": 1}),
     }
 
     def __init__(self, scheme_name: str = "black_and_white") -> None:
@@ -161,9 +369,34 @@ class ColorScheme:
             raise ValueError(f"Invalid color scheme: {scheme_name}")
         self._scheme_name = scheme_name
         self._color_map = self._available_schemes[scheme_name]
+        self._inverse_color_map = {v: k for k, v in self._color_map.items()}
+        self._rgba_lut = tuple(
+            bytes(COLOR_MAP[self._inverse_color_map[i]])
+            for i in sorted(self._inverse_color_map)
+        )
+        self._value_lut = {
+            _pack_rgba(COLOR_MAP[color]): value
+            for color, value in self._color_map.items()
+        }
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if hasattr(self, name):
+            raise AttributeError("ColorScheme objects are immutable.")
+        super().__setattr__(name, value)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ColorScheme):
+            return NotImplemented
+        return self._scheme_name == other._scheme_name
+
+    def __hash__(self) -> int:
+        return hash(self._scheme_name)
+
+    def __reduce__(self) -> Tuple[type, Tuple[str]]:
+        return (ColorScheme, (self._scheme_name,))
 
     def __str__(self) -> str:
-        return f"Unifont Color Scheme ({self._color_map})"
+        return f"Unifont Color Scheme ({dict(self._color_map)})"
 
     @property
     def name(self) -> str:
@@ -171,12 +404,51 @@ class ColorScheme:
         return self._scheme_name
 
     @property
-    def color_map(self) -> Dict[int, str]:
+    def color_map(self) -> Mapping[str, int]:
         """The color map of the color scheme."""
         return self._color_map
 
+    def values_of(self, pixels: Iterable[int]) -> bytearray:
+        """Get the pixel values of the colors of the color scheme.
 
-@dataclass
+        Args:
+            pixels (Iterable[int]): The RGBA colors of the pixels, each packed into an
+                integer in native byte order, as `memoryview.cast("I")` yields them.
+
+        Returns:
+            bytearray: The pixel value of each color.
+
+        Raises:
+            KeyError: If a color is not used by the color scheme.
+        """
+        return bytearray(map(self._value_lut.__getitem__, pixels))
+
+    def rgba_of(self, data: Iterable[int]) -> bytes:
+        """Get the RGBA bytes of pixel values in the color scheme.
+
+        Args:
+            data (Iterable[int]): The pixel values, each `0` or `1`.
+
+        Returns:
+            bytes: The RGBA bytes of all the pixels, four per pixel.
+        """
+        return b"".join(map(self._rgba_lut.__getitem__, data))
+
+
+@lru_cache(maxsize=None)
+def _get_color_scheme(scheme_name: str) -> ColorScheme:
+    """Get the shared ColorScheme object of a scheme name.
+
+    Color schemes are immutable, so one object per name is enough.
+    """
+    return ColorScheme(scheme_name)
+
+
+_DEFAULT_COLOR_SCHEME = _get_color_scheme("black_and_white")
+"""The color scheme shared by glyphs whose color scheme has not been set."""
+
+
+@dataclass(slots=True)
 class Glyph:
     """A class representing a single glyph in Unifont."""
 
@@ -186,13 +458,20 @@ class Glyph:
     """The width of the glyph."""
     _hex_str: str = field(default_factory=str)
     """The `.hex` format string of the glyph."""
-    _data: List[int] = field(default_factory=list)
-    """The pixel data of the glyph."""
-    _color_scheme: ColorScheme = ColorScheme()
+    _data: bytearray = field(default_factory=bytearray)
+    """The pixel data of the glyph, one byte of `0` or `1` per pixel."""
+    _color_scheme: ColorScheme = field(default_factory=lambda: _DEFAULT_COLOR_SCHEME)
     """The color scheme of the glyph."""
+    _code_point_int: int = field(init=False, repr=False, compare=False)
+    """The integer value of the code point, parsed once on creation."""
+    _data_bytes: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The decoded `.hex` format string, cached until the glyph changes."""
 
     def __post_init__(self) -> None:
         self._code_point = V.code_point(self._code_point)
+        self._code_point_int = int(self._code_point, 16)
 
     def __str__(self) -> str:
         code_point = self._code_point
@@ -211,6 +490,11 @@ class Glyph:
         """The code point of the character represented by the glyph."""
         return self._code_point
 
+    @property
+    def code_point_int(self) -> int:
+        """The code point of the character represented by the glyph, as an integer."""
+        return self._code_point_int
+
     @property
     def width(self) -> int:
         """The width of the glyph."""
@@ -221,8 +505,8 @@ class Glyph:
     @property
     def hex_str(self) -> str:
         """The `.hex` format string of the glyph."""
-        if not self._hex_str and self.data:
-            self._hex_str = C.to_hex(self.data)
+        if not self._hex_str and self._data:
+            self._hex_str = C.to_hex(self._data)
         return self._hex_str
 
     @hex_str.setter
@@ -230,24 +514,66 @@ class Glyph:
         """Set the `.hex` format string of the glyph."""
         self.load_hex(hex_str)
 
+    @property
+    def data_bytes(self) -> bytes:
+        """The `.hex` format string of the glyph decoded into bytes."""
+        if self._data_bytes is None:
+            self._data_bytes = bytes.fromhex(self.hex_str)
+        return self._data_bytes
+
     @property
     def data(self) -> List[int]:
         """The pixel data of the glyph."""
-        if not self._data and self.hex_str:
-            self._data = C.to_img_data(self.hex_str, self.width)
-        return self._data[:]
+        return list(self._data_view())
 
     @data.setter
     def data(self, data: List[int]) -> None:
         """Set the pixel data of the glyph."""
+        data = bytearray(map(bool, data))
+        hex_str = C.to_hex(data)
+        self._set_data_raw(data, hex_str, 16 if len(hex_str) == 64 else 8)
+
+    def _set_data_raw(self, data: bytearray, hex_str: str, width: int) -> None:
+        """Helper function to set the pixel data, `.hex` format string and width
+        of the glyph together, without converting between them."""
         self._data = data
-        self._hex_str = C.to_hex(data)
-        self._width = 16 if len(self._hex_str) == 64 else 8
+        self._hex_str = hex_str
+        self._width = width
+        self._data_bytes = None
+
+    def _data_view(self) -> bytearray:
+        """Helper function to get the pixel data of the glyph without copying it.
+        The returned bytearray must not be modified by the caller."""
+        if not self._data and self._hex_str:
+            self._data = bytearray(C.to_img_bytes(self._hex_str, self.width))
+        return self._data
 
     def update_data_at_index(self, index: int, value: int) -> None:
-        """Update the pixel data at a specific index."""
-        self._data[index] = value
-        self._hex_str = C.to_hex(self._data)
+        """Update the pixel data at a specific index.
+
+        Only the `.hex` digits of the row containing the pixel are recomputed.
+        """
+        value = 1 if value else 0
+        data = self._data_view()
+        # Raises `IndexError` for an index out of range before anything is changed.
+        data[index] = value
+        self._data_bytes = None
+        if not self._hex_str:
+            self._hex_str = C.to_hex(data)
+            return
+
+        # A negative index counts from the end, like the index into the data.
+        index %= len(data)
+        width = self.width
+        chars = width // 4
+        row, col = divmod(index, width)
+        start, end = row * chars, (row + 1) * chars
+        bit = 1 << (width - 1 - col)
+        row_value = int(self._hex_str[start:end], 16)
+        row_value = row_value | bit if value else row_value & ~bit
+        self._hex_str = (
+            f"{self._hex_str[:start]}{row_value:0{chars}X}{self._hex_str[end:]}"
+        )
 
     @property
     def color_scheme(self) -> ColorScheme:
@@ -264,51 +590,45 @@ class Glyph:
     ) -> ColorScheme:
         """Helper function to validate and create a ColorScheme object."""
         if isinstance(color_scheme, str):
-            return ColorScheme(color_scheme)
+            return _get_color_scheme(color_scheme)
         if isinstance(color_scheme, ColorScheme):
             return color_scheme
         raise TypeError("Invalid color scheme type. Must be a string or a ColorScheme.")
 
     @staticmethod
-    def _auto_detect_color_scheme(
-        width: int, rgba_values: List[Tuple[int, int, int, int]]
-    ) -> str:
-        """Helper function to automatically detect the color scheme of the glyph."""
+    def _auto_detect_color_scheme(width: int, pixels: Sequence[int]) -> str:
+        """Helper function to automatically detect the color scheme of the glyph.
 
-        valid_rgba_values = {(0, 0, 0, 255), (255, 255, 255, 255), (0, 0, 0, 0)}
+        The pixels are packed RGBA integers, as returned by `_packed_pixels`.
+        """
 
-        if not all(pixel in valid_rgba_values for pixel in rgba_values):
+        existed_colors = set(pixels)
+        if not existed_colors <= _PACKED_COLOR_VALUE_MAP.keys():
             raise ValueError("Invalid pixel RGBA values.")
-
-        existed_colors = set(rgba_values)
         if len(existed_colors) == 3:
             raise ValueError("Invalid pixel RGBA values.")
 
-        background_color_value = rgba_values[width - 1]
-        background_color =COLOR_VALUE_MAP[background_color_value]
-        existed_colors.remove(background_color_value)
-        foreground_color = COLOR_VALUE_MAP[existed_colors.pop()]
-
-        if background_color == "black" and foreground_color == "white":
-            return "inverted_black_and_white"
-        if background_color == "white" and foreground_color == "black":
-            return "black_and_white"
-        if background_color == "transparent" and foreground_color == "white":
-            return "transparent_and_white"
-        if background_color == "transparent" and foreground_color == "black":
-            return "transparent_and_black"
-        raise ValueError("Invalid pixel RGBA values.")
+        background_color = pixels[width - 1]
+        existed_colors.discard(background_color)
+        if not existed_colors:
+            raise ValueError("Invalid pixel RGBA values.")
+        foreground_color = existed_colors.pop()
+
+        try:
+            return _SCHEME_BY_PACKED_COLORS[(background_color, foreground_color)]
+        except KeyError:
+            raise ValueError("Invalid pixel RGBA values.") from None
 
     @property
     def character(self) -> str:
         """The character represented by the glyph."""
-        return chr(int(self._code_point, 16))
+        return chr(self._code_point_int)
 
     @property
     def unicode_name(self) -> str:
         """The Unicode name of the glyph."""
         try:
-            return name(chr(int(self._code_point, 16)))
+            return name(chr(self._code_point_int))
         except ValueError:
             return ""
 
@@ -321,9 +641,7 @@ class Glyph:
 
         hex_str = V.hex_str(hex_str)
         width = 16 if len(hex_str) == 64 else 8
-        self._hex_str = hex_str
-        self._width = width
-        self._data = C.to_img_data(hex_str, width)
+        self._set_data_raw(bytearray(C.to_img_bytes(hex_str, width)), hex_str, width)
 
     def load_img(
         self,
@@ -357,18 +675,17 @@ class Glyph:
             raise FileNotFoundError(f"File not found: {img_path}")
 
         img = Img.open(img_path).convert("RGBA")
-        rgba_values = list(img.getdata())
+        pixels = _packed_pixels(img)
         if color_auto_detect:
             try:
-                color_scheme = self._auto_detect_color_scheme(img.size[0], rgba_values)
+                color_scheme = self._auto_detect_color_scheme(img.size[0], pixels)
                 color_scheme = self._validate_and_create_color_scheme(color_scheme)
             except ValueError as e:
                 print(f"Warning: {e}. The glyph will not be changed.")
                 return
         self.color_scheme = color_scheme
-        self._width = img.size[0]
-        data = [color_scheme.color_map[COLOR_VALUE_MAP[pixel]] for pixel in rgba_values]
-        self._hex_str = C.to_hex(data)
+        data = color_scheme.values_of(pixels)
+        self._set_data_raw(data, C.to_hex(data), img.size[0])
 
     @classmethod
     def init_from_hex(cls, code_point: CodePoint, hex_str: str) -> "Glyph":
@@ -387,6 +704,20 @@ class Glyph:
 
         return cls(code_point, _hex_str=hex_str)
 
+    @classmethod
+    def _init_trusted(cls, code_point: str, hex_str: str = "") -> "Glyph":
+        """Helper function to create a Glyph object from an already normalized
+        code point and `.hex` format string, skipping validation."""
+        glyph = cls.__new__(cls)
+        glyph._code_point = code_point
+        glyph._code_point_int = int(code_point, 16)
+        glyph._width = 0
+        glyph._hex_str = hex_str
+        glyph._data = bytearray()
+        glyph._color_scheme = _DEFAULT_COLOR_SCHEME
+        glyph._data_bytes = None
+        return glyph
+
     @classmethod
     def init_from_img(
         cls,
@@ -446,10 +777,10 @@ class Glyph:
             raise ValueError(
                 "Invalid image format. The image format must be PNG or BMP."
             )
-        if len(self.data) != self.width * 16:
+        data = self._data_view()
+        if len(data) != self.width * 16:
             raise ValueError("Invalid glyph data or size.")
 
-        img = Img.new("RGBA", (self.width, 16))
         color_scheme = (
             self._validate_and_create_color_scheme(color_scheme)
             if color_scheme is not None
@@ -457,16 +788,15 @@ class Glyph:
         )
         if img_format == "BMP":
             if color_scheme.name == "transparent_and_black":
-                color_scheme = ColorScheme("black_and_white")
+                color_scheme = _get_color_scheme("black_and_white")
             elif color_scheme.name == "transparent_and_white":
-                color_scheme = ColorScheme("inverted_black_and_white")
+                color_scheme = _get_color_scheme("inverted_black_and_white")
             print(
                 "Warning: BMP format does not support transparency. "
                 "The image will be saved as a black and white image."
             )
-        color_dict =  {v: k for k, v in color_scheme.color_map.items()}
-        data = [COLOR_MAP[color_dict[pixel]] for pixel in self.data]
-        img.putdata(data)
+        rgba_bytes = color_scheme.rgba_of(data)
+        img = Img.frombuffer("RGBA", (self.width, 16), rgba_bytes, "raw", "RGBA", 0, 1)
         img.save(save_path, img_format)
 
     def print_glyph(
@@ -505,28 +835,28 @@ class Glyph:
         if color_scheme.name in {"inverted_black_and_white", "transparent_and_black"}:
             white_block, black_block = black_block, white_block
 
-        hex_length = self.width // 4 if display_hex else 0
+        width = self.width
+        hex_length = width // 4 if display_hex else 0
+        hex_str = self.hex_str
+        data = self._data_view()
 
         for i in range(16):
             row_text = Text()
+            row = data[i * width : (i + 1) * width]
 
-            for j in range(self.width):
+            for value, run in groupby(row):
                 row_text.append(
-                    "  ",
-                    style=(
-                        white_block if self.data[i * self.width + j] else black_block
-                    ),
+                    "  " * len(list(run)),
+                    style=white_block if value else black_block,
                 )
 
             if display_hex or display_bin:
                 prefix = []
                 if display_hex:
-                    hex_slice = self.hex_str[i * hex_length : (i + 1) * hex_length]
+                    hex_slice = hex_str[i * hex_length : (i + 1) * hex_length]
                     prefix.append(hex_slice)
                 if display_bin:
-                    bin_slice = "".join(
-                        str(self.data[i * self.width + j]) for j in range(self.width)
-                    )
+                    bin_slice = "".join(map(str, row))
                     prefix.append(bin_slice)
 
                 prefix_text = "\t".join(prefix)
@@ -547,7 +877,6 @@ class Glyph:
             ValueError: If the two patterns have different size.
         """
 
-        img_data = self.data
         pattern_a, pattern_b = search_pattern.data, replace_pattern.data
         if search_pattern.width > self.width:
             raise ValueError("The pattern to be searched is larger than the glyph.")
@@ -557,36 +886,17 @@ class Glyph:
         if len(pattern_a) != len(pattern_b):
             raise ValueError("The two patterns must have the same size.")
 
-        height = search_pattern.height
-        width = search_pattern.width
-        image_width = len(img_data) // 16
-
-        def match_pattern(i: int, j: int) -> bool:
-            for y in range(height):
-                for x in range(width):
-                    if (
-                        pattern_a[y * width + x] == 1
-                        and img_data[(i + y) * image_width + (j + x)] != 1
-                    ):
-                        return False
-            return True
-
-        def apply_pattern(i: int, j: int) -> None:
-            for y in range(height):
-                for x in range(width):
-                    pixel = pattern_b[y * width + x]
-                    index = (i + y) * image_width + (j + x)
-                    if pixel == 1:
-                        img_data[index] = 1
-                    elif pixel == 0:
-                        img_data[index] = 0
-
-        for i in range(16 - height + 1):
-            for j in range(image_width - width + 1):
-                if match_pattern(i, j):
-                    apply_pattern(i, j)
-
-        self.data = img_data
+        image_width = self.width
+        rows = _bytes_to_rows(self.data_bytes, image_width)
+        _replace_pattern(
+            rows,
+            image_width,
+            pattern_a,
+            pattern_b,
+            search_pattern.width,
+            search_pattern.height,
+        )
+        self.load_hex(_rows_to_hex(rows, image_width))
 
     def find_matches(self, search_pattern: SearchPattern) -> List[Tuple[int, int]]:
         """Finds all matches of a pattern in the image.
@@ -598,28 +908,52 @@ class Glyph:
             List[Tuple[int, int]]: List of coordinates where the pattern is found.
         """
 
+        return self.find_matches_in_region(search_pattern, 0, 0, 16, self.width)
+
+    def find_matches_in_region(
+        self,
+        search_pattern: SearchPattern,
+        top: int,
+        left: int,
+        bottom: int,
+        right: int,
+    ) -> List[Tuple[int, int]]:
+        """Finds the matches of a pattern that start within a region of the image.
+
+        Args:
+            search_pattern (SearchPattern): The pattern to be searched.
+            top (int): The first row coordinate of the region.
+            left (int): The first column coordinate of the region.
+            bottom (int): The row coordinate just below the region.
+            right (int): The column coordinate just right of the region.
+
+        Returns:
+            List[Tuple[int, int]]: List of coordinates where the pattern is found,
+                in row-major order.
+        """
+
         if search_pattern.width > self.width:
             raise ValueError("The pattern to be searched is larger than the glyph.")
-        pattern_a = search_pattern.data
 
         height = search_pattern.height
         width = search_pattern.width
-        image_width = len(self.data) // 16
+        image_width = self.width
+        max_shift = image_width - width
+        top, bottom = max(top, 0), min(bottom, 16 - height + 1)
+        left, right = max(left, 0), min(right, max_shift + 1)
+        if top >= bottom or left >= right:
+            return []
+
+        rows = _bytes_to_rows(self.data_bytes, image_width)
+        mask_bits = _mask_bits(_pack_rows(search_pattern.data, width, height), width)
         matches = []
 
-        def match_pattern(i: int, j: int) -> bool:
-            for y in range(height):
-                for x in range(width):
-                    if (
-                        pattern_a[y * width + x] == 1
-                        and self.data[(i + y) * image_width + (j + x)] != 1
-                    ):
-                        return False
-            return True
-
-        for i in range(16 - height + 1):
-            for j in range(image_width - width + 1):
-                if match_pattern(i, j):
+        for i in range(top, bottom):
+            candidates = _match_candidates(rows[i : i + height], mask_bits, max_shift)
+            if not candidates:
+                continue
+            for j in range(left, right):
+                if candidates >> (max_shift - j) & 1:
                     matches.append((i, j))
 
         return matches
@@ -639,23 +973,20 @@ class Glyph:
             raise ValueError("The pattern is out of bounds.")
         if j < 0 or j + replace_pattern.width > self.width:
             raise ValueError("The pattern is out of bounds.")
-        img_data = self.data.copy()
         pattern_b = replace_pattern.data
 
         height = replace_pattern.height
         width = replace_pattern.width
-        image_width = len(img_data) // 16
-
-        for y in range(height):
-            for x in range(width):
-                pixel = pattern_b[y * width + x]
-                index = (i + y) * image_width + (j + x)
-                if pixel == 1:
-                    img_data[index] = 1
-                elif pixel == 0:
-                    img_data[index] = 0
-
-        self.data = img_data
+        image_width = self.width
+        rows = _bytes_to_rows(self.data_bytes, image_width)
+        _apply_rows(
+            rows,
+            i,
+            image_width - width - j,
+            _pack_rows(pattern_b, width, height),
+            _pack_rows(pattern_b, width, height, 0),
+        )
+        self.load_hex(_rows_to_hex(rows, image_width))
 
 
 @dataclass
@@ -664,11 +995,19 @@ class GlyphSet:
 
     _glyphs: Dict[str, Glyph] = field(default_factory=dict)
     """A dictionary of glyphs in the set."""
+    _sorted: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether the glyphs are known to be sorted by their code points."""
+    _index: Optional[Tuple[List[int], List[Glyph]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The integer code points and the glyphs of the sorted set, for bisecting."""
 
     @property
     def glyphs(self) -> Dict[str, Glyph]:
         """A dictionary of glyphs in the set."""
         self.sort_glyphs()
+        # The caller may add glyphs to the returned dictionary.
+        self._sorted = False
         return self._glyphs
 
     @property
@@ -687,7 +1026,7 @@ class GlyphSet:
         return self.get_glyph(code_point)
 
     def __setitem__(self, code_point: CodePoint, hex_str: str) -> None:
-        self.add_glyph((code_point, hex_str))
+        self.add_glyph_tuple(code_point, hex_str)
 
     def __delitem__(self, code_point: CodePoint) -> None:
         self.remove_glyph(code_point)
@@ -708,6 +1047,7 @@ class GlyphSet:
             self.add_glyph(other)
         elif isinstance(other, GlyphSet):
             self._glyphs.update(other.glyphs)
+            self._sorted = False
         else:
             raise TypeError("Invalid type for in-place addition to GlyphSet.")
         return self
@@ -719,8 +1059,11 @@ class GlyphSet:
         return iter(self._glyphs.values())
 
     def __contains__(self, glyph: Union[Glyph, str]) -> bool:
-        code_point = V.code_point(glyph if isinstance(glyph, str) else glyph.code_point)
-        return code_point in self._glyphs
+        if isinstance(glyph, Glyph):
+            return glyph.code_point in self._glyphs
+        if isinstance(glyph, str) and glyph in self._glyphs:
+            return True
+        return V.code_point(glyph) in self._glyphs
 
     @classmethod
     def init_glyphs(cls, code_points: CodePoints) -> "GlyphSet":
@@ -734,8 +1077,7 @@ class GlyphSet:
         """
 
         code_points_list = V.code_points(code_points)
-        glyphs = {cp: Glyph.init_from_hex(cp, "") for cp in code_points_list}
-        return cls(_glyphs=glyphs)
+        return cls(_glyphs={cp: Glyph._init_trusted(cp) for cp in code_points_list})
 
     def get_glyph(self, code_point: CodePoint) -> Glyph:
         """Get a glyph by its code point.
@@ -747,6 +1089,11 @@ class GlyphSet:
             Glyph: The obtained glyph.
         """
 
+        # The keys are normalized code point strings, so a direct hit needs no
+        # validation. Anything else goes through the validator for its errors.
+        if isinstance(code_point, str):
+            if (glyph := self._glyphs.get(code_point)) is not None:
+                return glyph
         code_point = V.code_point(code_point)
         try:
             return self._glyphs[code_point]
@@ -772,14 +1119,18 @@ class GlyphSet:
             GlyphSet: The obtained set of glyphs.
         """
 
-        result = GlyphSet()
+        glyphs = self._glyphs
         code_points_list = V.code_points(code_points)
-        for code_point in code_points_list:
-            if code_point in self._glyphs:
-                result.add_glyph(self._glyphs[code_point])
-            elif not skip_empty:
-                result.add_glyph((code_point, ""))
-        return result
+        if skip_empty:
+            return GlyphSet(
+                _glyphs={cp: glyphs[cp] for cp in code_points_list if cp in glyphs}
+            )
+        return GlyphSet(
+            _glyphs={
+                cp: glyphs[cp] if cp in glyphs else Glyph._init_trusted(cp)
+                for cp in code_points_list
+            }
+        )
 
     def add_glyph(self, glyph: Union[Glyph, Tuple[CodePoint, str]]) -> None:
         """Add a glyph to the set.
@@ -790,12 +1141,38 @@ class GlyphSet:
                 If a tuple is provided, it should be in the format of `(code_point, hex_str)`.
         """
 
-        glyph_obj = self._validate_and_create_glyph(glyph)
-        if glyph_obj.code_point in self._glyphs:
+        if isinstance(glyph, tuple):
+            self.add_glyph_tuple(*glyph)
+        elif isinstance(glyph, Glyph):
+            self.add_glyph_obj(glyph)
+        else:
+            raise TypeError(
+                "Invalid glyph type. Must be a Glyph or a tuple (code_point, hex_str)."
+            )
+
+    def add_glyph_tuple(self, code_point: CodePoint, hex_str: str) -> None:
+        """Add a glyph to the set from a code point and a `.hex` format string.
+
+        Args:
+            code_point (CodePoint): The code point of the glyph to add.
+            hex_str (str): The `.hex` format string of the glyph to add.
+        """
+
+        self.add_glyph_obj(self._from_tuple(code_point, hex_str))
+
+    def add_glyph_obj(self, glyph: Glyph) -> None:
+        """Add a Glyph object to the set.
+
+        Args:
+            glyph (Glyph): The glyph to add.
+        """
+
+        if glyph.code_point in self._glyphs:
             raise ValueError(
-                f"Glyph with code point U+{glyph_obj.code_point} already exists."
+                f"Glyph with code point U+{glyph.code_point} already exists."
             )
-        self._glyphs[glyph_obj.code_point] = glyph_obj
+        self._glyphs[glyph.code_point] = glyph
+        self._sorted = False
 
     def remove_glyph(self, code_point: CodePoint) -> None:
         """Remove a glyph from the set.
@@ -808,6 +1185,7 @@ class GlyphSet:
         if code_point not in self._glyphs:
             raise KeyError(f"Glyph with code point U+{code_point} not found.")
         del self._glyphs[code_point]
+        self._index = None
 
     def update_glyph(self, glyph: Union[Glyph, Tuple[CodePoint, str]]) -> None:
         """Update a glyph in the set.
@@ -828,23 +1206,93 @@ class GlyphSet:
 
         if not self._glyphs:
             raise ValueError("Cannot sort an empty glyph set.")
-        self._glyphs = dict(sorted(self._glyphs.items(), key=lambda x: int(x[0], 16)))
+        if self._sorted:
+            return
+        glyphs = self._glyphs
+        # Sorting only the keys avoids building a list of item tuples as well.
+        order = sorted(glyphs, key=lambda code_point: glyphs[code_point].code_point_int)
+        self._glyphs = {code_point: glyphs[code_point] for code_point in order}
+        self._sorted = True
+        self._index = None
+
+    def _sorted_index(self) -> Tuple[List[int], List[Glyph]]:
+        """Helper function to sort the glyphs and get their integer code points
+        and the glyphs themselves as parallel lists, which can be bisected."""
+        if not self._glyphs:
+            return [], []
+        self.sort_glyphs()
+        if self._index is None:
+            glyphs = list(self._glyphs.values())
+            self._index = ([glyph.code_point_int for glyph in glyphs], glyphs)
+        return self._index
+
+    def hex_strs_for_page(self, page: int) -> List[Optional[str]]:
+        """Get the `.hex` format strings of the glyphs in a Unicode page.
+
+        Args:
+            page (int): The number of the page, e.g. `0x4E` for U+4E00 to U+4EFF.
+
+        Returns:
+            List[Optional[str]]: The 256 `.hex` format strings of the page, indexed by
+                the low byte of the code point. Code points without a glyph are `None`.
+        """
+
+        code_points, glyphs = self._sorted_index()
+        start = page << 8
+        first = bisect_left(code_points, start)
+        last = bisect_left(code_points, start + 256, first)
+
+        hex_strs: List[Optional[str]] = [None] * 256
+        for code_point, glyph in zip(code_points[first:last], glyphs[first:last]):
+            hex_strs[code_point - start] = glyph.hex_str
+        return hex_strs
 
     def _validate_and_create_glyph(
         self, glyph: Union[Glyph, Tuple[CodePoint, str]]
     ) -> Glyph:
         """Helper function to validate and create a Glyph object."""
+        if isinstance(glyph, tuple):
+            return self._from_tuple(*glyph)
         if isinstance(glyph, Glyph):
             return glyph
-        if isinstance(glyph, tuple):
-            code_point, hex_str = glyph
-            code_point = V.code_point(code_point)
-            hex_str = V.hex_str(hex_str)
-            return Glyph.init_from_hex(code_point, hex_str)
         raise TypeError(
             "Invalid glyph type. Must be a Glyph or a tuple (code_point, hex_str)."
         )
 
+    @staticmethod
+    def _from_tuple(code_point: CodePoint, hex_str: str) -> Glyph:
+        """Helper function to validate a code point and a `.hex` format string
+        and create a Glyph object from them."""
+        return Glyph._init_trusted(V.code_point(code_point), V.hex_str(hex_str))
+
+    @staticmethod
+    def _parse_hex_bytes(data: Union[bytes, mmap.mmap]) -> Optional[Dict[str, Glyph]]:
+        """Helper function to parse the contents of a `.hex` file in one regex scan.
+
+        Returns `None` if any line is malformed or repeated.
+        """
+        matches = _HEX_LINE_PATTERN.findall(data)
+        if len(matches) != len(_NON_BLANK_LINE_PATTERN.findall(data)):
+            return None
+
+        glyphs = {}
+        for raw_code_point, hex_str in matches:
+            digits = raw_code_point.upper().decode("ascii")
+            code_point = digits.zfill(6 if len(digits) > 4 else 4)
+            glyph = Glyph._init_trusted(code_point, hex_str.decode("ascii"))
+            if glyph.code_point_int > 0x10FFFF:
+                return None
+            glyphs[code_point] = glyph
+        return glyphs if len(glyphs) == len(matches) else None
+
+    @classmethod
+    def _glyph_from_line(cls, line: str) -> Glyph:
+        """Helper function to create a Glyph object from a line of a `.hex` file."""
+        code_point, sep, hex_str = line.partition(":")
+        if not sep:
+            raise ValueError(f"Invalid line in file: {line}")
+        return cls._from_tuple(code_point, hex_str)
+
     @classmethod
     def load_hex_file(cls, file_path: FilePath) -> "GlyphSet":
         """Parse and load a `.hex` file.
@@ -860,14 +1308,22 @@ class GlyphSet:
         if not file_path.exists():
             raise FileNotFoundError(f"File not found: {file_path}")
 
-        glyphs = GlyphSet()
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if l := line.strip():
-                    if ":" not in line:
-                        raise ValueError(f"Invalid line in file: {l}")
-                    code_point, hex_str = l.split(":", 1)
-                    glyphs.add_glyph((code_point, hex_str))
+        parsed: Optional[Dict[str, Glyph]] = {}
+        if file_path.stat().st_size:  # an empty file cannot be memory-mapped
+            with file_path.open("rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as data:
+                parsed = cls._parse_hex_bytes(data)
+
+        if parsed is not None:
+            glyphs = GlyphSet(_glyphs=parsed)
+        else:
+            # Parse again line by line to report the first invalid or repeated line.
+            glyphs = GlyphSet()
+            with file_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    if l := line.strip():
+                        glyphs.add_glyph_obj(cls._glyph_from_line(l))
 
         elapsed_time = time.time() - start_time
         print(
@@ -888,8 +1344,10 @@ class GlyphSet:
 
         file_path = V.file_path(file_path)
         with file_path.open("w", encoding="utf-8") as f:
-            for code_point, glyph in sorted(self._glyphs.items()):
-                f.write(f"{code_point}:{glyph.hex_str}\n")
+            f.writelines(
+                f"{code_point}:{glyph.hex_str}\n"
+                for code_point, glyph in sorted(self._glyphs.items())
+            )
 
         elapsed_time = time.time() - start_time
         print(
@@ -915,32 +1373,92 @@ class GlyphSet:
         file_path = V.file_path(file_path)
         start = int(start, 16) if isinstance(start, str) else start
 
-        img = Img.new("RGBA", (256, 256))
-        position = 0
-        for code_point, glyph in self._glyphs.items():
-            if int(code_point, 16) < start:
-                continue
+        img, position = self._render_unicode_page(start)
+        img.save(file_path)
 
-            if glyph.hex_str:
-                glyph_img = Img.new("RGBA", (16, 16))
-                rgba_data = [
-                    (255, 255, 255, 255) if pixel else (0, 0, 0, 0)
-                    for pixel in C.to_img_data(glyph.hex_str)
-                ]
-                glyph_img.putdata(rgba_data)
+        elapsed_time = time.time() - start_time
+        print(
+            f'Saved {position} glyphs to "{file_path.name}". '
+            f"Time elapsed: {elapsed_time:.2f} s."
+        )
+
+    def save_unicode_pages(
+        self,
+        dir_path: FilePath,
+        pages: Iterable[int],
+        *,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        """Save several Unicode page images for Minecraft in parallel.
 
-                x = (position % 16) * 16
-                y = (position // 16) * 16
-                img.paste(glyph_img, (x, y))
+        Each page holds the 256 code points `XX00` to `XXFF`, with every glyph in the
+        cell of the low byte of its code point, and is saved as `unicode_page_XX.png`
+        in the directory, where `XX` is the page number in lowercase hexadecimal.
+        Pages without any glyphs, e.g. every page of an empty set, are saved blank.
 
-            position += 1
-            if position >= 256:
-                break
+        Args:
+            dir_path (FilePath): The path to the directory to save the pages in.
+            pages (Iterable[int]): The numbers of the pages to save, e.g. `0x4E`.
+            max_workers (int, optional): The maximum number of threads to use.
 
-        img.save(file_path)
+                Defaults to the default of `ThreadPoolExecutor`.
+        """
+
+        start_time = time.time()
+
+        # Build the index up front so that the threads only read it.
+        self._sorted_index()
+        dir_path = V.file_path(dir_path)
+        dir_path.mkdir(parents=True, exist_ok=True)
+
+        def save_page(page: int) -> None:
+            self._draw_unicode_page(self.hex_strs_for_page(page)).save(
+                dir_path / f"unicode_page_{page:02x}.png"
+            )
+
+        # Pillow releases the GIL while encoding, so the pages are saved in threads.
+        with ThreadPoolExecutor(max_workers) as executor:
+            count = len(list(executor.map(save_page, pages)))
 
         elapsed_time = time.time() - start_time
         print(
-            f'Saved {position} glyphs to "{file_path.name}". '
+            f'Saved {count} pages to "{dir_path.name}". '
             f"Time elapsed: {elapsed_time:.2f} s."
         )
+
+    def _render_unicode_page(self, start: int) -> Tuple[Img.Image, int]:
+        """Helper function to draw a Unicode page image from the next 256 sorted glyphs,
+        returning the image and the number of glyphs placed on it."""
+        code_points, glyphs = self._sorted_index()
+        first = bisect_left(code_points, start)
+        page = glyphs[first : first + 256]
+        return self._draw_unicode_page([glyph.hex_str for glyph in page]), len(page)
+
+    @staticmethod
+    def _draw_unicode_page(hex_strs: Sequence[Optional[str]]) -> Img.Image:
+        """Helper function to draw a Unicode page image from the `.hex` format strings
+        of its cells in order. Empty and `None` cells are left blank."""
+
+        # The whole page as `.hex` bytes in raster order. Each item of `rows` is one
+        # 16-pixel glyph row, and the rows of a glyph are 16 items apart.
+        raster = bytearray(256 * 32)
+        rows = memoryview(raster).cast("H")
+        for position, hex_str in enumerate(hex_strs):
+            if hex_str:
+                band, column = divmod(position, 16)
+                offset = band * 256 + column
+                # Shorter `.hex` strings are zero-filled to a full 16x16 glyph.
+                raw = bytes.fromhex(hex_str).rjust(32, b"\0")
+                rows[offset : offset + 256 : 16] = memoryview(raw).cast("H")
+
+        mask = Img.frombuffer(
+            "L",
+            (256, 256),
+            b"".join(map(_BYTE_TO_MASK.__getitem__, raster)),
+            "raw",
+            "L",
+            0,
+            1,
+        )
+        # Set pixels are opaque white and the others fully transparent.
+        return Img.merge("RGBA", (mask, mask, mask, mask))